@@ -222,17 +222,10 @@ class _AsyncioEventStoreDBClient(BaseEventStoreDBClient):
         self, grpc_target: str, grpc_options: GrpcOptions = ()
     ) -> AsyncioESDBConnection:
         grpc_options = self.grpc_options + grpc_options
-        if self.connection_spec.options.Tls is True:
-            if self.root_certificates is not None:
-                root_certificates = self.root_certificates.encode()
-            else:
-                root_certificates = None
-            channel_credentials = grpc.ssl_channel_credentials(
-                root_certificates=root_certificates
-            )
+        if self._channel_credentials is not None:
             grpc_channel = grpc.aio.secure_channel(
                 target=grpc_target,
-                credentials=channel_credentials,
+                credentials=self._channel_credentials,
                 options=grpc_options,
             )
         else:
@@ -375,6 +368,31 @@ class _AsyncioEventStoreDBClient(BaseEventStoreDBClient):
         ) as events:
             return tuple([e async for e in events])
 
+    @retrygrpc
+    @autoreconnect
+    async def count_stream_events(
+        self,
+        stream_name: str,
+        *,
+        stream_position: Optional[int] = None,
+        backwards: bool = False,
+        limit: int = sys.maxsize,
+        timeout: Optional[float] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+    ) -> int:
+        """
+        Returns the number of recorded events in the named stream.
+        """
+        read_response = await self.read_stream(
+            stream_name=stream_name,
+            stream_position=stream_position,
+            backwards=backwards,
+            limit=limit,
+            timeout=timeout,
+            credentials=credentials or self._call_credentials,
+        )
+        return await read_response.count()
+
     async def read_stream(
         self,
         stream_name: str,
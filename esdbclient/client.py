@@ -43,6 +43,8 @@ from esdbclient.common import (
 )
 from esdbclient.connection import ESDBConnection
 from esdbclient.connection_spec import (
+    COMPRESSION_DEFLATE,
+    COMPRESSION_GZIP,
     NODE_PREFERENCE_FOLLOWER,
     NODE_PREFERENCE_LEADER,
     NODE_PREFERENCE_RANDOM,
@@ -81,6 +83,12 @@ ESDB_PERSISTENT_CONFIG_EVENTS_REGEX = r"PersistentConfig\d+"
 
 DEFAULT_EXCLUDE_FILTER = (ESDB_SYSTEM_EVENTS_REGEX, ESDB_PERSISTENT_CONFIG_EVENTS_REGEX)
 
+# Maps the "Compression" connection option to gRPC compression algorithms.
+GRPC_COMPRESSIONS = {
+    COMPRESSION_GZIP: grpc.Compression.Gzip,
+    COMPRESSION_DEFLATE: grpc.Compression.Deflate,
+}
+
 _TCallable = TypeVar("_TCallable", bound=Callable[..., Any])
 
 
@@ -152,7 +160,10 @@ class BaseEventStoreDBClient:
         )
         if self.connection_spec.options.KeepAliveInterval is not None:
             self.grpc_options += (
-                ("grpc.keepalive_ms", self.connection_spec.options.KeepAliveInterval),
+                (
+                    "grpc.keepalive_time_ms",
+                    self.connection_spec.options.KeepAliveInterval,
+                ),
             )
         if self.connection_spec.options.KeepAliveTimeout is not None:
             self.grpc_options += (
@@ -162,6 +173,14 @@ class BaseEventStoreDBClient:
                 ),
             )
 
+        if self.connection_spec.options.Compression is not None:
+            self.grpc_options += (
+                (
+                    "grpc.default_compression_algorithm",
+                    int(GRPC_COMPRESSIONS[self.connection_spec.options.Compression]),
+                ),
+            )
+
         self._call_metadata = (
             ("connection-name", self.connection_spec.options.ConnectionName),
         )
@@ -170,6 +189,17 @@ class BaseEventStoreDBClient:
             self.connection_spec.username, self.connection_spec.password
         )
 
+        # Channel credentials are constructed once, and used for every channel.
+        self._channel_credentials: Optional[grpc.ChannelCredentials] = None
+        if self.connection_spec.options.Tls is True:
+            self._channel_credentials = grpc.ssl_channel_credentials(
+                root_certificates=(
+                    root_certificates.encode()
+                    if root_certificates is not None
+                    else None
+                )
+            )
+
     @property
     def is_closed(self) -> bool:
         return self._is_closed
@@ -330,17 +360,10 @@ class EventStoreDBClient(BaseEventStoreDBClient):
         self, grpc_target: str, grpc_options: GrpcOptions = ()
     ) -> grpc.Channel:
         grpc_options = self.grpc_options + grpc_options
-        if self.connection_spec.options.Tls is True:
-            if self.root_certificates is not None:
-                root_certificates = self.root_certificates.encode()
-            else:
-                root_certificates = None
-            channel_credentials = grpc.ssl_channel_credentials(
-                root_certificates=root_certificates
-            )
+        if self._channel_credentials is not None:
             grpc_channel = grpc.secure_channel(
                 target=grpc_target,
-                credentials=channel_credentials,
+                credentials=self._channel_credentials,
                 options=grpc_options,
             )
         else:
@@ -536,6 +559,30 @@ class EventStoreDBClient(BaseEventStoreDBClient):
         ) as events:
             return tuple(events)
 
+    @retrygrpc
+    @autoreconnect
+    def count_stream_events(
+        self,
+        stream_name: str,
+        *,
+        stream_position: Optional[int] = None,
+        backwards: bool = False,
+        limit: int = sys.maxsize,
+        timeout: Optional[float] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+    ) -> int:
+        """
+        Returns the number of recorded events in the named stream.
+        """
+        return self.read_stream(
+            stream_name=stream_name,
+            stream_position=stream_position,
+            backwards=backwards,
+            limit=limit,
+            timeout=timeout,
+            credentials=credentials or self._call_credentials,
+        ).count()
+
     def read_stream(
         self,
         stream_name: str,
@@ -6,6 +6,8 @@ from threading import Lock
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Dict,
     Generic,
     Iterator,
     Optional,
@@ -145,54 +147,77 @@ class BasicAuthCallCredentials(grpc.AuthMetadataPlugin):
         callback(self._metadata, None)
 
 
+RpcCall = Union[grpc.Call, grpc.aio.AioRpcError]
+
+
+def _handle_unknown(e: RpcCall) -> EventStoreDBClientException:
+    if "Exception was thrown by handler" in str(e.details()):
+        return ExceptionThrownByHandler(e)
+    return GrpcError(e)
+
+
+def _handle_aborted(e: RpcCall) -> EventStoreDBClientException:
+    details = e.details()
+    if isinstance(details, str) and "Consumer too slow" in details:
+        return ConsumerTooSlow()
+    else:
+        return AbortedByServer()
+
+
+def _handle_cancelled(e: RpcCall) -> EventStoreDBClientException:
+    if e.details() == "Locally cancelled by application!":
+        return CancelledByClient(e)
+    return GrpcError(e)
+
+
+def _handle_unavailable(e: RpcCall) -> EventStoreDBClientException:
+    details = e.details() or ""
+    if "SSL_ERROR" in details:
+        # root_certificates is None and CA cert not installed
+        return SSLError(e)
+    if "empty address list:" in details:
+        # given root_certificates is invalid
+        return SSLError(e)
+    return ServiceUnavailable(details)
+
+
+def _handle_not_found(e: RpcCall) -> EventStoreDBClientException:
+    if e.details() == "Leader info available":
+        return NodeIsNotLeader(e)
+    return NotFound()
+
+
+def _handle_failed_precondition(e: RpcCall) -> EventStoreDBClientException:
+    details = e.details()
+    if details is not None and details.startswith("Maximum subscriptions reached"):
+        return MaximumSubscriptionsReached(details)
+    else:  # pragma: no cover
+        return FailedPrecondition(details)
+
+
+_RPC_ERROR_HANDLERS: Dict[
+    grpc.StatusCode, Callable[[RpcCall], EventStoreDBClientException]
+] = {
+    grpc.StatusCode.UNKNOWN: _handle_unknown,
+    grpc.StatusCode.ABORTED: _handle_aborted,
+    grpc.StatusCode.CANCELLED: _handle_cancelled,
+    grpc.StatusCode.DEADLINE_EXCEEDED: GrpcDeadlineExceeded,
+    grpc.StatusCode.UNAVAILABLE: _handle_unavailable,
+    grpc.StatusCode.ALREADY_EXISTS: lambda e: AlreadyExists(e.details()),
+    grpc.StatusCode.NOT_FOUND: _handle_not_found,
+    grpc.StatusCode.FAILED_PRECONDITION: _handle_failed_precondition,
+    grpc.StatusCode.INTERNAL: lambda e: InternalError(e.details()),  # pragma: no cover
+}
+
+
 def handle_rpc_error(e: grpc.RpcError) -> EventStoreDBClientException:
     """
     Converts gRPC errors to client exceptions.
     """
     if isinstance(e, (grpc.Call, grpc.aio.AioRpcError)):
-        if (
-            e.code() == grpc.StatusCode.UNKNOWN
-            and "Exception was thrown by handler" in str(e.details())
-        ):
-            return ExceptionThrownByHandler(e)
-        elif e.code() == grpc.StatusCode.ABORTED:
-            details = e.details()
-            if isinstance(details, str) and "Consumer too slow" in details:
-                return ConsumerTooSlow()
-            else:
-                return AbortedByServer()
-        elif (
-            e.code() == grpc.StatusCode.CANCELLED
-            and e.details() == "Locally cancelled by application!"
-        ):
-            return CancelledByClient(e)
-        elif e.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
-            return GrpcDeadlineExceeded(e)
-        elif e.code() == grpc.StatusCode.UNAVAILABLE:
-            details = e.details() or ""
-            if "SSL_ERROR" in details:
-                # root_certificates is None and CA cert not installed
-                return SSLError(e)
-            if "empty address list:" in details:
-                # given root_certificates is invalid
-                return SSLError(e)
-            return ServiceUnavailable(details)
-        elif e.code() == grpc.StatusCode.ALREADY_EXISTS:
-            return AlreadyExists(e.details())
-        elif e.code() == grpc.StatusCode.NOT_FOUND:
-            if e.details() == "Leader info available":
-                return NodeIsNotLeader(e)
-            return NotFound()
-        elif e.code() == grpc.StatusCode.FAILED_PRECONDITION:
-            details = e.details()
-            if details is not None and details.startswith(
-                "Maximum subscriptions reached"
-            ):
-                return MaximumSubscriptionsReached(details)
-            else:  # pragma: no cover
-                return FailedPrecondition(details)
-        elif e.code() == grpc.StatusCode.INTERNAL:  # pragma: no cover
-            return InternalError(e.details())
+        handler = _RPC_ERROR_HANDLERS.get(e.code())
+        if handler is not None:
+            return handler(e)
     return GrpcError(e)
 
 
@@ -275,17 +300,18 @@ def construct_recorded_event(
     else:
         retry_count = None
 
+    event_metadata = event.metadata
+    try:
+        recorded_at = datetime.datetime.fromtimestamp(
+            int(event_metadata.get("created", "")) / 10000000.0,
+            tz=datetime.timezone.utc,
+        )
+    except (TypeError, ValueError):  # pragma: no cover
+        recorded_at = None
+
     if link.id.string == "":
         recorded_event_link: Optional[RecordedEvent] = None
     else:
-        try:
-            recorded_at = datetime.datetime.fromtimestamp(
-                int(event.metadata.get("created", "")) / 10000000.0,
-                tz=datetime.timezone.utc,
-            )
-        except (TypeError, ValueError):  # pragma: no cover
-            recorded_at = None
-
         recorded_event_link = RecordedEvent(
             id=UUID(link.id.string),
             type=link.metadata.get("type", ""),
@@ -299,20 +325,12 @@ def construct_recorded_event(
             recorded_at=recorded_at,
         )
 
-    try:
-        recorded_at = datetime.datetime.fromtimestamp(
-            int(event.metadata.get("created", "")) / 10000000.0,
-            tz=datetime.timezone.utc,
-        )
-    except (TypeError, ValueError):  # pragma: no cover
-        recorded_at = None
-
     recorded_event = RecordedEvent(
         id=UUID(event.id.string),
-        type=event.metadata.get("type", ""),
+        type=event_metadata.get("type", ""),
         data=event.data,
         metadata=event.custom_metadata,
-        content_type=event.metadata.get("content-type", ""),
+        content_type=event_metadata.get("content-type", ""),
         stream_name=event.stream_identifier.stream_name.decode("utf8"),
         stream_position=event.stream_revision,
         commit_position=None if ignore_commit_position else event.commit_position,
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
-from typing import Any, Dict, Optional, Sequence
-from urllib.parse import ParseResult, parse_qs, urlparse
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import ParseResult, parse_qsl, urlparse
 from uuid import uuid4
 
 URI_SCHEME_ESDB = "esdb"
@@ -19,6 +19,12 @@ VALID_NODE_PREFERENCES = [
     NODE_PREFERENCE_RANDOM,
     NODE_PREFERENCE_REPLICA,
 ]
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_DEFLATE = "deflate"
+VALID_COMPRESSIONS = [
+    COMPRESSION_GZIP,
+    COMPRESSION_DEFLATE,
+]
 VALID_CONNECTION_QUERY_STRING_FIELDS = [
     "Tls",
     "ConnectionName",
@@ -30,131 +36,110 @@ VALID_CONNECTION_QUERY_STRING_FIELDS = [
     "DefaultDeadline",
     "KeepAliveInterval",
     "KeepAliveTimeout",
+    "Compression",
 ]
 
 
-class ConnectionOptions:
-    __slots__ = [f"_{s}" for s in VALID_CONNECTION_QUERY_STRING_FIELDS]
+_BOOL_VALUES = {"true": True, "false": False}
 
-    def __init__(self, query: str):
-        # Parse query string (case insensitivity, assume single values).
-        options = {k.upper(): v[0] for k, v in parse_qs(query).items()}
-
-        self._validate_field_names(options)
-        self._set_Tls(options)
-        self._set_ConnectionName(options)
-        self._set_MaxDiscoverAttempts(options)
-        self._set_DiscoveryInterval(options)
-        self._set_GossipTimeout(options)
-        self._set_NodePreference(options)
-        self._set_TlsVerifyCert(options)
-        self._set_DefaultDeadline(options)
-        self._set_KeepAliveInterval(options)
-        self._set_KeepAliveTimeout(options)
-
-    @staticmethod
-    def _validate_field_names(options: Dict[str, Any]) -> None:
-        valid_fields = [s.upper() for s in VALID_CONNECTION_QUERY_STRING_FIELDS]
-        invalid_fields = []
-        for field in options.keys():
-            if field not in valid_fields:
-                invalid_fields.append(field)
-        if len(invalid_fields) > 0:
-            plural = "s" if len(invalid_fields) > 1 else ""
-            joined_fields = ", ".join(invalid_fields)
-            raise ValueError(
-                f"Unknown field{plural} in connection query string: {joined_fields}"
-            )
 
-    def _set_Tls(self, options: Dict[str, Any]) -> None:
-        _Tls = options.get("Tls".upper())
-        if _Tls is None:
-            self._Tls = True
-        else:
-            validTlsValues = ["true", "false"]
-            if _Tls.lower() not in validTlsValues:
-                raise ValueError(f"'{_Tls}' not one of: {', '.join(validTlsValues)}")
-            elif _Tls.lower() == "true":
-                self._Tls = True
-            else:
-                self._Tls = False
-
-    def _set_ConnectionName(self, options: Dict[str, Any]) -> None:
-        _ConnectionName = options.get("ConnectionName".upper())
-        if _ConnectionName is None:
-            self._ConnectionName = str(uuid4())
-        else:
-            self._ConnectionName = _ConnectionName
+def _parse_bool(value: str) -> bool:
+    parsed = _BOOL_VALUES.get(value.lower())
+    if parsed is None:
+        raise ValueError(f"'{value}' not one of: {', '.join(_BOOL_VALUES)}")
+    return parsed
 
-    def _set_MaxDiscoverAttempts(self, options: Dict[str, Any]) -> None:
-        _MaxDiscoverAttempts = options.get("MaxDiscoverAttempts".upper())
-        if _MaxDiscoverAttempts is None:
-            self._MaxDiscoverAttempts = 10
-        else:
-            self._MaxDiscoverAttempts = int(_MaxDiscoverAttempts)
 
-    def _set_DiscoveryInterval(self, options: Dict[str, Any]) -> None:
-        _DiscoveryInterval = options.get("DiscoveryInterval".upper())
-        if _DiscoveryInterval is None:
-            self._DiscoveryInterval = 100
-        else:
-            self._DiscoveryInterval = int(_DiscoveryInterval)
+def _parse_node_preference(value: str) -> str:
+    if value.lower() not in VALID_NODE_PREFERENCES:
+        raise ValueError(f"'{value}' not one of: {', '.join(VALID_NODE_PREFERENCES)}")
+    return value.lower()
 
-    def _set_GossipTimeout(self, options: Dict[str, Any]) -> None:
-        _GossipTimeout = options.get("GossipTimeout".upper())
-        if _GossipTimeout is None:
-            self._GossipTimeout = 5
-        else:
-            self._GossipTimeout = int(_GossipTimeout)
 
-    def _set_NodePreference(self, options: Dict[str, Any]) -> None:
-        _NodePreference = options.get("NodePreference".upper())
-        if _NodePreference is None:
-            self._NodePreference = NODE_PREFERENCE_LEADER
-        else:
-            if _NodePreference.lower() not in VALID_NODE_PREFERENCES:
-                raise ValueError(
-                    f"'{_NodePreference}' not one of:"
-                    f" {', '.join(VALID_NODE_PREFERENCES)}"
-                )
-            self._NodePreference = _NodePreference.lower()
-
-    def _set_TlsVerifyCert(self, options: Dict[str, Any]) -> None:
-        _TlsVerifyCert = options.get("TlsVerifyCert".upper())
-        if _TlsVerifyCert is None:
-            self._TlsVerifyCert = True
-        else:
-            validTlsVerifyCertValues = ["true", "false"]
-            if _TlsVerifyCert.lower() not in validTlsVerifyCertValues:
-                raise ValueError(
-                    f"'{_TlsVerifyCert}' not one of:"
-                    f" {', '.join(validTlsVerifyCertValues)}"
-                )
-            elif _TlsVerifyCert.lower() == "true":
-                self._TlsVerifyCert = True
-            else:
-                self._TlsVerifyCert = False
-
-    def _set_DefaultDeadline(self, options: Dict[str, Any]) -> None:
-        _DefaultDeadline = options.get("DefaultDeadline".upper())
-        if _DefaultDeadline is None:
-            self._DefaultDeadline: Optional[int] = None
-        else:
-            self._DefaultDeadline = int(_DefaultDeadline)
+def _parse_compression(value: str) -> str:
+    if value.lower() not in VALID_COMPRESSIONS:
+        raise ValueError(f"'{value}' not one of: {', '.join(VALID_COMPRESSIONS)}")
+    return value.lower()
 
-    def _set_KeepAliveInterval(self, options: Dict[str, Any]) -> None:
-        _KeepAliveInterval = options.get("KeepAliveInterval".upper())
-        if _KeepAliveInterval is None:
-            self._KeepAliveInterval: Optional[int] = None
-        else:
-            self._KeepAliveInterval = int(_KeepAliveInterval)
 
-    def _set_KeepAliveTimeout(self, options: Dict[str, Any]) -> None:
-        _KeepAliveTimeout = options.get("KeepAliveTimeout".upper())
-        if _KeepAliveTimeout is None:
-            self._KeepAliveTimeout: Optional[int] = None
+def _default_connection_name() -> str:
+    return str(uuid4())
+
+
+# Maps each query string field to a function that parses a given value, and
+# a function that returns the default value for when the field is not given.
+_QUERY_STRING_FIELD_PARSERS: Dict[
+    str, Tuple[Callable[[str], Any], Callable[[], Any]]
+] = {
+    "Tls": (_parse_bool, lambda: True),
+    "ConnectionName": (str, _default_connection_name),
+    "MaxDiscoverAttempts": (int, lambda: 10),
+    "DiscoveryInterval": (int, lambda: 100),
+    "GossipTimeout": (int, lambda: 5),
+    "NodePreference": (_parse_node_preference, lambda: NODE_PREFERENCE_LEADER),
+    "TlsVerifyCert": (_parse_bool, lambda: True),
+    "DefaultDeadline": (int, lambda: None),
+    "KeepAliveInterval": (int, lambda: None),
+    "KeepAliveTimeout": (int, lambda: None),
+    "Compression": (_parse_compression, lambda: None),
+}
+
+# Query string field names are case insensitive.
+_QUERY_STRING_FIELD_NAMES = {s.upper(): s for s in _QUERY_STRING_FIELD_PARSERS}
+
+
+def _parse_query_string(query: str) -> Dict[str, Any]:
+    # Parses the values given in a query string. Field names are case insensitive.
+    # A repeated field uses its first value, but when a field is given with names
+    # that differ only in case (e.g. "tls" and "Tls") the last of these is used.
+    # Defaults aren't included, since some of them (e.g. ConnectionName) must be
+    # generated afresh for each client.
+    values: Dict[str, str] = {}
+    for key, value in parse_qsl(query):
+        values.setdefault(key, value)
+
+    options: Dict[str, str] = {}
+    invalid_fields: List[str] = []
+    for key, value in values.items():
+        field = key.upper()
+        if field not in _QUERY_STRING_FIELD_NAMES:
+            if field not in invalid_fields:
+                invalid_fields.append(field)
         else:
-            self._KeepAliveTimeout = int(_KeepAliveTimeout)
+            options[_QUERY_STRING_FIELD_NAMES[field]] = value
+
+    if len(invalid_fields) > 0:
+        plural = "s" if len(invalid_fields) > 1 else ""
+        joined_fields = ", ".join(invalid_fields)
+        raise ValueError(
+            f"Unknown field{plural} in connection query string: {joined_fields}"
+        )
+
+    return {
+        name: _QUERY_STRING_FIELD_PARSERS[name][0](value)
+        for name, value in options.items()
+    }
+
+
+class ConnectionOptions:
+    __slots__ = [f"_{s}" for s in VALID_CONNECTION_QUERY_STRING_FIELDS]
+
+    _Tls: bool
+    _ConnectionName: str
+    _MaxDiscoverAttempts: int
+    _DiscoveryInterval: int
+    _GossipTimeout: int
+    _NodePreference: str
+    _TlsVerifyCert: bool
+    _DefaultDeadline: Optional[int]
+    _KeepAliveInterval: Optional[int]
+    _KeepAliveTimeout: Optional[int]
+    _Compression: Optional[str]
+
+    def __init__(self, query: str):
+        given = _parse_query_string(query)
+        for name, (_, default) in _QUERY_STRING_FIELD_PARSERS.items():
+            setattr(self, f"_{name}", given[name] if name in given else default())
 
     @property
     def Tls(self) -> bool:
@@ -236,6 +221,15 @@ class ConnectionOptions:
         """
         return self._KeepAliveTimeout
 
+    @property
+    def Compression(self) -> Optional[str]:
+        """
+        gRPC compression algorithm for calls to the server (default: no compression).
+
+        Valid values in URI: 'gzip', 'deflate'.
+        """
+        return self._Compression
+
 
 class ConnectionSpec:
     __slots__ = [
@@ -92,6 +92,14 @@ CONSUMER_STRATEGIES: Dict[
     "Pinned": persistent_pb2.UpdateReq.ConsumerStrategy.Pinned,
 }
 
+NACK_ACTIONS: Dict[str, persistent_pb2.ReadReq.Nack.Action.ValueType] = {
+    "unknown": persistent_pb2.ReadReq.Nack.Unknown,
+    "park": persistent_pb2.ReadReq.Nack.Park,
+    "retry": persistent_pb2.ReadReq.Nack.Retry,
+    "skip": persistent_pb2.ReadReq.Nack.Skip,
+    "stop": persistent_pb2.ReadReq.Nack.Stop,
+}
+
 
 class BaseSubscriptionReadReqs:
     def __init__(
@@ -144,22 +152,11 @@ class BaseSubscriptionReadReqs:
                 )
             )
         else:
-            if action == "unknown":
-                grpc_action = persistent_pb2.ReadReq.Nack.Unknown
-            elif action == "park":
-                grpc_action = persistent_pb2.ReadReq.Nack.Park
-            elif action == "retry":
-                grpc_action = persistent_pb2.ReadReq.Nack.Retry
-            elif action == "skip":
-                grpc_action = persistent_pb2.ReadReq.Nack.Skip
-            else:
-                assert action == "stop"
-                grpc_action = persistent_pb2.ReadReq.Nack.Stop
             read_req = persistent_pb2.ReadReq(
                 nack=persistent_pb2.ReadReq.Nack(
                     id=subscription_id,
                     ids=ids,
-                    action=grpc_action,
+                    action=NACK_ACTIONS[action],
                 )
             )
         return read_req
@@ -176,6 +176,25 @@ class AsyncioReadResponse(
                 await self.stop()
                 raise
 
+    async def count(self) -> int:
+        """
+        Consumes the response, and returns the number of recorded events,
+        without constructing a RecordedEvent object for each one.
+        """
+        count = 0
+        try:
+            while True:
+                read_resp = await self._get_next_read_resp()
+                content_oneof = read_resp.WhichOneof("content")
+                if content_oneof == "stream_not_found":
+                    raise NotFound(f"Stream {self._stream_name!r} not found")
+                elif content_oneof == "event" and read_resp.event.event.id.string:
+                    count += 1
+        except (StopAsyncIteration, CancelledByClient):
+            return count
+        finally:
+            await self.stop()
+
     async def _get_next_read_resp(self) -> streams_pb2.ReadResp:
         try:
             read_resp = await self.read_resp_iter.__anext__()
@@ -263,6 +282,25 @@ class ReadResponse(Iterator[RecordedEvent], BaseReadResponse, SyncGrpcStreamer):
                 self.stop()
                 raise
 
+    def count(self) -> int:
+        """
+        Consumes the response, and returns the number of recorded events,
+        without constructing a RecordedEvent object for each one.
+        """
+        count = 0
+        try:
+            while True:
+                read_resp = self._get_next_read_resp()
+                content_oneof = read_resp.WhichOneof("content")
+                if content_oneof == "stream_not_found":
+                    raise NotFound(f"Stream {self._stream_name!r} not found")
+                elif content_oneof == "event" and read_resp.event.event.id.string:
+                    count += 1
+        except (StopIteration, CancelledByClient):
+            return count
+        finally:
+            self.stop()
+
     def _get_next_read_resp(self) -> streams_pb2.ReadResp:
         try:
             read_resp = next(self._read_resps)
@@ -508,17 +546,17 @@ class BaseStreamsService(ESDBService[TGrpcStreamers]):
                 assert current_version is StreamState.NO_STREAM
                 options.no_stream.CopyFrom(empty_pb2.Empty())
 
-        # Construct batch request 'proposed_messages'.
-        # Todo: Split batch.events into chunks of 20?
-        proposed_messages = []
-        for event in events:
-            proposed_message = streams_pb2.BatchAppendReq.ProposedMessage(
+        # Construct batch request 'proposed_messages'. All the events go in
+        # a single final request, so that the append is one gRPC message.
+        proposed_messages = [
+            streams_pb2.BatchAppendReq.ProposedMessage(
                 id=shared_pb2.UUID(string=str(event.id)),
                 metadata={"type": event.type, "content-type": event.content_type},
                 custom_metadata=event.metadata,
                 data=event.data,
             )
-            proposed_messages.append(proposed_message)
+            for event in events
+        ]
         return streams_pb2.BatchAppendReq(
             correlation_id=shared_pb2.UUID(string=str(correlation_id)),
             options=options,
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 import asyncio
 import sys
-from typing import Optional
+from typing import List, Optional
 from unittest import skipIf
 
 from esdbclient.common import (
@@ -22,6 +22,7 @@ from tests.test_client import (
     EVENTSTORE_IMAGE_TAG,
     TimedTestCase,
     get_ca_certificate,
+    new_group_name,
     random_data,
 )
 
@@ -30,7 +31,7 @@ if sys.version_info[0:2] > (3, 7):
 else:
     from async_case import IsolatedAsyncioTestCase
 
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from esdbclient import Checkpoint, NewEvent, StreamState
 from esdbclient.asyncio_client import (
@@ -213,7 +214,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
 
     async def test_append_events_and_get_stream(self) -> None:
         # Append events.
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         event2 = NewEvent(type="OrderCreated", data=b"{}")
         await self.client.append_events(
@@ -224,13 +225,36 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
 
         # Read stream events.
         events = await self.client.get_stream(stream_name1)
-        self.assertEqual(len(events), 2)
-        self.assertEqual(events[0].id, event1.id)
-        self.assertEqual(events[1].id, event2.id)
+        self.assertEqual([e.id for e in events], [event1.id, event2.id])
+
+    async def test_count_stream_events(self) -> None:
+        stream_name1 = self.new_stream_name()
+        with self.assertRaises(NotFound):
+            await self.client.count_stream_events(stream_name1)
+
+        await self.client.append_events(
+            stream_name=stream_name1,
+            events=[NewEvent(type="OrderCreated", data=b"{}") for _ in range(3)],
+            current_version=StreamState.NO_STREAM,
+        )
+
+        self.assertEqual(3, await self.client.count_stream_events(stream_name1))
+        self.assertEqual(
+            2, await self.client.count_stream_events(stream_name1, stream_position=1)
+        )
+        self.assertEqual(
+            2, await self.client.count_stream_events(stream_name1, limit=2)
+        )
+        self.assertEqual(
+            2,
+            await self.client.count_stream_events(
+                stream_name1, stream_position=1, backwards=True
+            ),
+        )
 
     async def test_append_events_and_read_all(self) -> None:
         # Append events.
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name1,
@@ -238,7 +262,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             current_version=StreamState.NO_STREAM,
         )
 
-        stream_name2 = str(uuid4())
+        stream_name2 = self.new_stream_name()
         event2 = NewEvent(type="OrderCreated", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name2,
@@ -254,7 +278,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
 
     async def test_get_commit_position(self) -> None:
         # Append events.
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         commit_position1 = await self.client.append_events(
             stream_name=stream_name1,
@@ -271,9 +295,9 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
 
     async def test_get_current_version(self) -> None:
         # Append events.
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         current_version = await self.client.get_current_version(stream_name1)
-        self.assertEqual(StreamState.NO_STREAM, current_version)
+        self.assertIs(StreamState.NO_STREAM, current_version)
 
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         await self.client.append_events(
@@ -287,7 +311,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
         self.assertEqual(0, current_version)
 
     async def test_stream_metadata_get_and_set(self) -> None:
-        stream_name = str(uuid4())
+        stream_name = self.new_stream_name()
 
         # Append batch of new events.
         event1 = NewEvent(type="OrderCreated", data=random_data())
@@ -330,7 +354,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
         self.assertIn(metadata["$tb"], [2, max_long])
 
         # Get and set metadata for a stream that does not exist.
-        stream_name = str(uuid4())
+        stream_name = self.new_stream_name()
         metadata, version = await self.client.get_stream_metadata(stream_name)
         self.assertEqual(metadata, {})
 
@@ -389,7 +413,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             await self.client.get_stream_metadata(stream_name)
 
     async def test_append_events_raises_not_found(self) -> None:
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         with self.assertRaises(NotFound):
             await self.client.append_events(
@@ -397,7 +421,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             )
 
     async def test_append_events_raises_wrong_current_version(self) -> None:
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name1,
@@ -414,7 +438,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
     async def test_append_events_reconnects_closed_connection(self) -> None:
         await self.client._connection.close()
         # Append events.
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name1,
@@ -425,7 +449,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
     async def test_append_events_raises_service_unavailable(self) -> None:
         await self.client._connection.close()
         self.client.connection_spec._targets = ["localhost:2222"]
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         with self.assertRaises(ServiceUnavailable):
             await self.client.append_events(
@@ -437,7 +461,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
     async def test_append_events_raises_discovery_failed(self) -> None:
         await self.client._connection.close()
         self.client.connection_spec._targets = ["localhost:2222", "localhost:2222"]
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         with self.assertRaises(DiscoveryFailed):
             await self.client.append_events(
@@ -448,7 +472,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
 
     async def test_append_events_raises_node_is_not_leader(self) -> None:
         await self.setup_reader()
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         with self.assertRaises(NodeIsNotLeader):
             await self.reader.append_events(
@@ -458,7 +482,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             )
 
     async def test_append_events_raises_stream_is_deleted(self) -> None:
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name1,
@@ -479,7 +503,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
 
     async def test_stream_append_to_stream(self) -> None:
         # This method exists to match other language clients.
-        stream_name = str(uuid4())
+        stream_name = self.new_stream_name()
 
         event1 = NewEvent(type="OrderCreated", data=random_data())
         event2 = NewEvent(type="OrderUpdated", data=random_data())
@@ -509,7 +533,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
         self.assertEqual(events[2].commit_position, commit_position2)
 
     async def test_get_stream_raises_stream_is_deleted(self) -> None:
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name1,
@@ -527,7 +551,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
         await self.setup_reader()
         self.reader.connection_spec.options._NodePreference = "leader"
 
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         await self.reader.append_events(
             stream_name=stream_name1,
@@ -539,7 +563,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
         await self.setup_reader()
         self.reader.connection_spec.options._NodePreference = "leader"
 
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         events = [NewEvent(type="SomethingHappened", data=b"{}") for _ in range(1000)]
         with self.assertRaises(GrpcDeadlineExceeded):
             await self.reader.append_events(
@@ -551,17 +575,17 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
 
     async def test_get_stream_raises_not_found(self) -> None:
         with self.assertRaises(NotFound):
-            await self.client.get_stream(str(uuid4()))
+            await self.client.get_stream(self.new_stream_name())
 
     async def test_get_stream_reconnects(self) -> None:
         await self.client._connection.close()
         with self.assertRaises(NotFound):
-            await self.client.get_stream(str(uuid4()))
+            await self.client.get_stream(self.new_stream_name())
 
     async def test_get_stream_raises_service_unavailable(self) -> None:
         await self.client._connection.close()
         self.client.connection_spec._targets = ["localhost:2222"]
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         with self.assertRaises(ServiceUnavailable):
             await self.client.append_events(
@@ -571,7 +595,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             )
 
     async def test_delete_stream_raises_stream_not_found(self) -> None:
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
 
         with self.assertRaises(NotFound):
             await self.client.delete_stream(
@@ -579,7 +603,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             )
 
     async def test_delete_stream_raises_wrong_current_version(self) -> None:
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name1,
@@ -591,7 +615,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             await self.client.delete_stream(stream_name1, current_version=10)
 
     async def test_delete_stream_raises_stream_is_deleted(self) -> None:
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name1,
@@ -606,7 +630,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
     async def test_delete_stream_reconnects_to_leader(self) -> None:
         await self.setup_writer()
 
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         await self.writer.append_events(
             stream_name=stream_name1,
@@ -620,7 +644,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
         await self.reader.delete_stream(stream_name1, current_version=0)
 
     async def test_tombstone_stream_raises_stream_not_found(self) -> None:
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
 
         with self.assertRaises(NotFound):
             await self.client.tombstone_stream(
@@ -628,7 +652,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             )
 
     async def test_tombstone_stream_raises_wrong_current_version(self) -> None:
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name1,
@@ -640,7 +664,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             await self.client.tombstone_stream(stream_name1, current_version=10)
 
     async def test_tombstone_stream_raises_stream_is_deleted(self) -> None:
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name1,
@@ -655,7 +679,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
     async def test_tombstone_stream_reconnects_to_leader(self) -> None:
         await self.setup_writer()
 
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         await self.writer.append_events(
             stream_name=stream_name1,
@@ -670,7 +694,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
 
     async def test_subscribe_to_all(self) -> None:
         # Append events.
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name1,
@@ -678,7 +702,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             current_version=StreamState.NO_STREAM,
         )
 
-        stream_name2 = str(uuid4())
+        stream_name2 = self.new_stream_name()
         event2 = NewEvent(type="OrderCreated", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name2,
@@ -693,12 +717,11 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             events.append(event)
             if event.id == event2.id:
                 await catchup_subscription.stop()
-        self.assertEqual(events[-2].id, event1.id)
-        self.assertEqual(events[-1].id, event2.id)
+        self.assertEqual([e.id for e in events[-2:]], [event1.id, event2.id])
 
     async def test_subscribe_to_all_with_gather(self) -> None:
         # Append events.
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name1,
@@ -706,7 +729,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             current_version=StreamState.NO_STREAM,
         )
 
-        stream_name2 = str(uuid4())
+        stream_name2 = self.new_stream_name()
         event2 = NewEvent(type="OrderCreated", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name2,
@@ -728,6 +751,37 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
 
         await asyncio.gather(Worker(self.client).run(), Worker(self.client).run())
 
+    async def test_subscribe_to_all_while_appending(self) -> None:
+        # Subscribe from the end, then consume and append concurrently.
+        catchup_subscription = await self.client.subscribe_to_all(from_end=True)
+
+        event1 = NewEvent(type="OrderCreated", data=b"{}")
+        event2 = NewEvent(type="OrderUpdated", data=b"{}")
+
+        async def consume() -> List[UUID]:
+            event_ids = []
+            async for event in catchup_subscription:
+                event_ids.append(event.id)
+                if event.id == event2.id:
+                    await catchup_subscription.stop()
+            return event_ids
+
+        async def append() -> None:
+            stream_name = self.new_stream_name()
+            await self.client.append_events(
+                stream_name=stream_name,
+                events=[event1],
+                current_version=StreamState.NO_STREAM,
+            )
+            await self.client.append_events(
+                stream_name=stream_name,
+                events=[event2],
+                current_version=0,
+            )
+
+        event_ids, _ = await asyncio.gather(consume(), append())
+        self.assertEqual(event_ids[-2:], [event1.id, event2.id])
+
     async def test_subscribe_to_all_reconnects(self) -> None:
         # Reconstruct connection with wrong port (to inspire UsageError).
         await self.client._connection.close()
@@ -746,7 +800,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
         event1 = NewEvent(type="OrderCreated", data=random_data())
         event2 = NewEvent(type="OrderUpdated", data=random_data())
         event3 = NewEvent(type="OrderDeleted", data=random_data())
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         await self.client.append_events(
             stream_name1,
             current_version=StreamState.NO_STREAM,
@@ -779,7 +833,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
 
         # Append new events.
         event1 = NewEvent(type="OrderCreated", data=random_data())
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         await self.client.append_events(
             stream_name1,
             current_version=StreamState.NO_STREAM,
@@ -801,7 +855,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
 
     async def test_subscribe_to_stream(self) -> None:
         # Append events.
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name1,
@@ -809,7 +863,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             current_version=StreamState.NO_STREAM,
         )
 
-        stream_name2 = str(uuid4())
+        stream_name2 = self.new_stream_name()
         event2 = NewEvent(type="OrderCreated", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name2,
@@ -836,8 +890,8 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
         self.assertEqual(events[-1].id, event2.id)
 
     async def test_subscription_to_stream_update(self) -> None:
-        group_name = f"my-subscription-{uuid4().hex}"
-        stream_name = f"my-stream-{uuid4().hex}"
+        group_name = new_group_name()
+        stream_name = self.new_stream_name()
 
         # Can't update subscription that doesn't exist.
         with self.assertRaises(NotFound):
@@ -1423,7 +1477,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
         event1 = NewEvent(type="OrderCreated", data=random_data())
 
         # Append new events.
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         await self.client.append_events(
             stream_name1,
             current_version=StreamState.NO_STREAM,
@@ -1442,7 +1496,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
 
     async def test_persistent_subscription_to_all(self) -> None:
         # Check subscription does not exist.
-        group_name = str(uuid4())
+        group_name = new_group_name()
         with self.assertRaises(NotFound):
             await self.client.get_subscription_info(group_name)
 
@@ -1450,7 +1504,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
         await self.client.create_subscription_to_all(group_name, from_end=True)
 
         # Append events.
-        stream_name1 = str(uuid4())
+        stream_name1 = self.new_stream_name()
         event1 = NewEvent(type="OrderCreated1", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name1,
@@ -1458,7 +1512,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             current_version=StreamState.NO_STREAM,
         )
 
-        stream_name2 = str(uuid4())
+        stream_name2 = self.new_stream_name()
         event2 = NewEvent(type="OrderCreated2", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name2,
@@ -1481,20 +1535,18 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             if event.id == event2.id:
                 await persistent_subscription.stop()
 
-        self.assertEqual(len(events), 2)
-        self.assertEqual(events[-2].id, event1.id)
-        self.assertEqual(events[-1].id, event2.id)
+        self.assertEqual([e.id for e in events], [event1.id, event2.id])
 
         # Replay parked.
         # - append more events
-        stream_name3 = str(uuid4())
+        stream_name3 = self.new_stream_name()
         event3 = NewEvent(type="OrderCreated3", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name3,
             events=[event3],
             current_version=StreamState.NO_STREAM,
         )
-        stream_name4 = str(uuid4())
+        stream_name4 = self.new_stream_name()
         event4 = NewEvent(type="OrderCreated4", data=b"{}")
         await self.client.append_events(
             stream_name=stream_name4,
@@ -1513,9 +1565,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             if event.id == event4.id:
                 await persistent_subscription.stop()
 
-        self.assertEqual(len(events), 2)
-        self.assertEqual(events[-2].id, event3.id)
-        self.assertEqual(events[-1].id, event4.id)
+        self.assertEqual([e.id for e in events], [event3.id, event4.id])
 
         # - park events
         events = []
@@ -1529,9 +1579,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             if event.id == event4.id:
                 await persistent_subscription.stop()
 
-        self.assertEqual(len(events), 2)
-        self.assertEqual(events[-2].id, event3.id)
-        self.assertEqual(events[-1].id, event4.id)
+        self.assertEqual([e.id for e in events], [event3.id, event4.id])
 
         # - call replay_parked_events()
         await self.client.replay_parked_events(group_name=group_name)
@@ -1544,9 +1592,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             await persistent_subscription.ack(event)
             if event.id == event4.id:
                 await persistent_subscription.stop()
-        self.assertEqual(len(events), 2)
-        self.assertEqual(events[-2].id, event3.id)
-        self.assertEqual(events[-1].id, event4.id)
+        self.assertEqual([e.id for e in events], [event3.id, event4.id])
 
         # Get subscription info.
         info = await self.client.get_subscription_info(group_name)
@@ -1589,7 +1635,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             await self.client.replay_parked_events(group_name)
 
     async def test_subscription_to_all_update(self) -> None:
-        group_name = f"my-subscription-{uuid4().hex}"
+        group_name = new_group_name()
 
         # Can't update subscription that doesn't exist.
         with self.assertRaises(NotFound):
@@ -2157,9 +2203,9 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
 
     async def test_persistent_subscription_to_stream(self) -> None:
         # Check subscription does not exist.
-        group_name = str(uuid4())
-        stream_name1 = str(uuid4())
-        stream_name2 = str(uuid4())
+        group_name = new_group_name()
+        stream_name1 = self.new_stream_name()
+        stream_name2 = self.new_stream_name()
         with self.assertRaises(NotFound):
             await self.client.get_subscription_info(group_name, stream_name1)
 
@@ -2324,7 +2370,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
         with self.assertRaises(NotFound):
             await self.client.replay_parked_events(group_name, stream_name1)
         subscription_infos = await self.client.list_subscriptions_to_stream(
-            str(uuid4())
+            self.new_stream_name()
         )
         self.assertEqual(subscription_infos, [])
 
@@ -2332,8 +2378,8 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
         await self.setup_reader()
         await self.setup_writer()
 
-        group_name = str(uuid4())
-        stream_name1 = str(uuid4())
+        group_name = new_group_name()
+        stream_name1 = self.new_stream_name()
         with self.assertRaises(NodeIsNotLeader):
             await self.reader.get_subscription_info(group_name, stream_name1)
 
@@ -2372,8 +2418,8 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             await self.reader.delete_subscription(group_name)
 
     async def test_persistent_subscription_raises_deadline_exceeded(self) -> None:
-        group_name = str(uuid4())
-        stream_name1 = str(uuid4())
+        group_name = new_group_name()
+        stream_name1 = self.new_stream_name()
 
         await self.client.create_subscription_to_all(group_name)
         await self.client.create_subscription_to_stream(group_name, stream_name1)
@@ -2418,8 +2464,8 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
             await self.client.delete_subscription(group_name, timeout=0)
 
     async def test_persistent_subscription_reconnects_closed_connection(self) -> None:
-        group_name = str(uuid4())
-        stream_name1 = str(uuid4())
+        group_name = new_group_name()
+        stream_name1 = self.new_stream_name()
         await self.client._connection.close()
         await self.client.create_subscription_to_all(group_name)
 
@@ -2459,7 +2505,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
         await self.client.delete_subscription(group_name, stream_name1)
 
     async def test_persistent_subscription_stop_called_twice(self) -> None:
-        group_name = str(uuid4())
+        group_name = new_group_name()
         await self.client._connection.close()
         await self.client.create_subscription_to_all(group_name)
         s = await self.client.read_subscription_to_all(group_name)
@@ -2469,7 +2515,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
         self.assertTrue(s._is_stopped)
 
     async def test_persistent_subscription_raises_programming_error(self) -> None:
-        group_name = str(uuid4())
+        group_name = new_group_name()
         await self.client._connection.close()
         await self.client.create_subscription_to_all(group_name)
         s = await self.client.read_subscription_to_all(group_name)
@@ -2504,7 +2550,7 @@ class TestAsyncioEventStoreDBClient(TimedTestCase, IsolatedAsyncioTestCase):
         self.assertEqual(len(req5.ack.ids), 2)
 
     async def test_persistent_subscription_context_manager(self) -> None:
-        group_name = str(uuid4())
+        group_name = new_group_name()
         await self.client._connection.close()
         await self.client.create_subscription_to_all(group_name)
         s = await self.client.read_subscription_to_all(group_name)
@@ -1,18 +1,18 @@
 # -*- coding: utf-8 -*-
-import os
 from typing import List
-from unittest import TestCase
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from esdbclient import EventStoreDBClient, NewEvent, StreamState
-from tests.test_client import get_ca_certificate, get_server_certificate
+from tests.test_client import (
+    TimedTestCase,
+    get_ca_certificate,
+    get_server_certificate,
+    new_group_name,
+    random_data,
+)
 
 
-def random_data() -> bytes:
-    return os.urandom(16)
-
-
-class TestPersistentSubscriptionACK(TestCase):
+class TestPersistentSubscriptionACK(TimedTestCase):
     client: EventStoreDBClient
 
     ESDB_TARGET = "localhost:2114"
@@ -40,6 +40,7 @@ class TestPersistentSubscriptionACK(TestCase):
             )
 
     def setUp(self) -> None:
+        super().setUp()
         self.construct_esdb_client()
 
     def tearDown(self) -> None:
@@ -48,7 +49,7 @@ class TestPersistentSubscriptionACK(TestCase):
             self.client.close()
 
     def given_subscription(self) -> str:
-        group_name = f"my-subscription-{uuid4().hex}"
+        group_name = new_group_name()
         # print(f"  Given subscription {group_name}")
         self.client.create_subscription_to_all(group_name=group_name, from_end=True)
         return group_name
@@ -56,7 +57,7 @@ class TestPersistentSubscriptionACK(TestCase):
     def when_append_new_events(self, *data: bytes) -> List[UUID]:
         events = [NewEvent(type="AnEvent", data=d, metadata=b"{}") for d in data]
         self.client.append_events(
-            str(uuid4()),
+            self.new_stream_name(),
             current_version=StreamState.NO_STREAM,
             events=events,
         )